@@ -1,12 +1,14 @@
 """Pytest fixtures for testing install-cli.sh."""
 
+import atexit
+import functools
 import hashlib
-import io
 import os
-import stat
+import select
+import shlex
+import signal
 import subprocess
-import tarfile
-import tempfile
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -14,39 +16,41 @@ import pytest
 
 SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "install-cli.sh"
 
+# Don't even collect the real-network integration tests unless requested
+# (./run.sh --slow); the common `pytest` run stays a pure unit-test run.
+if os.environ.get("RUN_SLOW") != "1":
+    collect_ignore = ["test_integration.py"]
+
 # =============================================================================
 # Test Helpers
 # =============================================================================
 
 
-def create_mock_tarball(version: str = "v1.0.0") -> bytes:
-    """Create a minimal tar.gz containing a fake 'miru' binary."""
-    buffer = io.BytesIO()
-    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
-        content = f"#!/bin/sh\necho 'miru {version}'\n".encode()
-        info = tarfile.TarInfo(name="miru")
-        info.size = len(content)
-        info.mode = 0o755
-        tar.addfile(info, io.BytesIO(content))
-    buffer.seek(0)
-    return buffer.read()
-
-
+@functools.lru_cache(maxsize=4)
 def create_checksums(tarball: bytes) -> str:
-    """Generate checksums file for all supported platforms."""
+    """Generate checksums file for all supported platforms.
+
+    Memoized: the same tarball bytes are reused across the whole session,
+    so each distinct payload is hashed exactly once.
+    """
     checksum = hashlib.sha256(tarball).hexdigest()
     platforms = ["Linux_x86_64", "Linux_arm64", "Darwin_x86_64", "Darwin_arm64"]
     return "\n".join(f"{checksum}  cli_{p}.tar.gz" for p in platforms) + "\n"
 
 
 def assert_install_success(result: subprocess.CompletedProcess, verbose: bool = False) -> None:
-    """Assert that installation completed successfully."""
+    """Assert that installation completed successfully.
+
+    Output is bytes; it is only decoded for human-readable failure messages.
+    """
     if verbose:
-        print(f"\n--- stdout ---\n{result.stdout}")
+        print(f"\n--- stdout ---\n{result.stdout.decode()}")
         if result.stderr:
-            print(f"--- stderr ---\n{result.stderr}")
-    assert result.returncode == 0, f"Install failed:\n{result.stderr}"
-    assert "successfully installed to" in result.stdout, f"Missing success message:\n{result.stdout}"
+            print(f"--- stderr ---\n{result.stderr.decode()}")
+    assert result.returncode == 0, f"Install failed:\n{result.stderr.decode()}"
+    assert b"successfully installed to" in result.stdout, (
+        f"Missing success message:\n{result.stdout.decode()}"
+    )
 
 
 # =============================================================================
@@ -55,6 +59,11 @@ def assert_install_success(result: subprocess.CompletedProcess, verbose: bool =
 
 LATEST_VERSION = "v0.9.0"
 
+# Invalid gzip payload for corrupt-tarball tests; its checksums are computed
+# once at import time so the per-test hash/join is skipped entirely.
+_CORRUPT_TARBALL = b"not a valid tarball"
+_CORRUPT_CHECKSUMS = create_checksums(_CORRUPT_TARBALL)
+
 
 @dataclass
 class MockConfig:
@@ -67,15 +76,55 @@ class MockConfig:
     empty_response: bool = False
     bad_checksum: bool = False
     corrupt_tarball: bool = False
-    slow_download: float = 0  # Delay in seconds
+    hang_download: bool = False  # Block the tarball download indefinitely
     api_error_message: str = ""  # Simulate GitHub API error response (e.g., "Not Found")
 
 
+# The script body is identical for every test; only the data directory
+# varies, so it is injected via MOCK_CURL_DATA and the script itself is
+# written once per session (see mock_curl_script_dir).
+MOCK_CURL_SCRIPT = '''#!/bin/sh
+DATA="${MOCK_CURL_DATA:?}"
+. "$DATA/flags"
+
+# Parse args to find URL and output file
+URL="" OUTPUT=""
+while [ $# -gt 0 ]; do
+    case "$1" in
+        -o) OUTPUT="$2"; shift 2 ;;
+        -*) shift ;;
+        *)  URL="$1"; shift ;;
+    esac
+done
+
+# Check failure flags
+[ "$FAIL_API" = "1" ] && case "$URL" in *api.github.com*) exit 1 ;; esac
+[ "$FAIL_DOWNLOAD" = "1" ] && case "$URL" in *.tar.gz) exit 22 ;; esac
+[ "$FAIL_CHECKSUM" = "1" ] && case "$URL" in *checksums*) exit 22 ;; esac
+
+# Simulate a hung download: the fifo has no writer, so the read blocks
+# until the test's timeout kills this process group
+if [ "$HANG_DOWNLOAD" = "1" ]; then
+    case "$URL" in *.tar.gz) cat "$DATA/block" > /dev/null ;; esac
+fi
+
+# Serve content based on URL
+serve() { [ -n "$OUTPUT" ] && cp "$1" "$OUTPUT" || cat "$1"; }
+
+case "$URL" in
+    *releases/latest*) cat "$DATA/api.json" ;;
+    *.tar.gz)          serve "$DATA/binary.tar.gz" ;;
+    *checksums*)       serve "$DATA/checksums.txt" ;;
+    *)                 echo "Unknown URL: $URL" >&2; exit 1 ;;
+esac
+'''
+
+
 class MockCurl:
-    """Creates a mock curl script for testing."""
+    """Creates mock curl data files served by the shared session script."""
 
-    def __init__(self, directory: Path, tarball: bytes, config: MockConfig):
-        self.dir = directory
+    def __init__(self, directory: Path, tarball: bytes, config: MockConfig, script_dir: Path):
+        self.dir = script_dir
         self.data_dir = directory / "data"
         self.tarball = tarball
         self.config = config
@@ -84,7 +133,6 @@ class MockCurl:
         """Write all mock files."""
         self.data_dir.mkdir(exist_ok=True)
         self._write_data()
-        self._write_script()
 
     def _write_data(self) -> None:
         """Write data files that mock curl will serve."""
@@ -101,8 +149,7 @@ class MockCurl:
 
         # Binary tarball
         if cfg.corrupt_tarball:
-            # Invalid gzip data
-            (self.data_dir / "binary.tar.gz").write_bytes(b"not a valid tarball")
+            (self.data_dir / "binary.tar.gz").write_bytes(_CORRUPT_TARBALL)
         else:
             (self.data_dir / "binary.tar.gz").write_bytes(self.tarball)
 
@@ -112,60 +159,20 @@ class MockCurl:
             checksums = "0" * 64 + "  cli_Linux_x86_64.tar.gz\n"
         elif cfg.corrupt_tarball:
             # Checksum matches the corrupt data so extraction is attempted
-            corrupt_checksum = hashlib.sha256(b"not a valid tarball").hexdigest()
-            platforms = ["Linux_x86_64", "Linux_arm64", "Darwin_x86_64", "Darwin_arm64"]
-            checksums = "\n".join(f"{corrupt_checksum}  cli_{p}.tar.gz" for p in platforms) + "\n"
+            checksums = _CORRUPT_CHECKSUMS
         else:
             checksums = create_checksums(self.tarball)
         (self.data_dir / "checksums.txt").write_text(checksums)
 
-        # Config flags
-        (self.data_dir / "fail_api").write_text("1" if cfg.fail_api else "0")
-        (self.data_dir / "fail_download").write_text("1" if cfg.fail_download else "0")
-        (self.data_dir / "fail_checksum").write_text("1" if cfg.fail_checksum else "0")
-        (self.data_dir / "slow_download").write_text(str(cfg.slow_download))
-
-    def _write_script(self) -> None:
-        """Write the mock curl shell script."""
-        script = self.dir / "curl"
-        script.write_text(self._generate_script())
-        script.chmod(script.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-
-    def _generate_script(self) -> str:
-        return f'''#!/bin/sh
-DATA="{self.data_dir}"
-
-# Parse args to find URL and output file
-URL="" OUTPUT=""
-while [ $# -gt 0 ]; do
-    case "$1" in
-        -o) OUTPUT="$2"; shift 2 ;;
-        -*) shift ;;
-        *)  URL="$1"; shift ;;
-    esac
-done
-
-# Check failure flags
-[ "$(cat "$DATA/fail_api")" = "1" ] && case "$URL" in *api.github.com*) exit 1 ;; esac
-[ "$(cat "$DATA/fail_download")" = "1" ] && case "$URL" in *.tar.gz) exit 22 ;; esac
-[ "$(cat "$DATA/fail_checksum")" = "1" ] && case "$URL" in *checksums*) exit 22 ;; esac
-
-# Simulate slow download
-DELAY=$(cat "$DATA/slow_download" 2>/dev/null || echo 0)
-if [ "$DELAY" != "0" ]; then
-    case "$URL" in *.tar.gz) sleep "$DELAY" ;; esac
-fi
-
-# Serve content based on URL
-serve() {{ [ -n "$OUTPUT" ] && cp "$1" "$OUTPUT" || cat "$1"; }}
-
-case "$URL" in
-    *releases/latest*) cat "$DATA/api.json" ;;
-    *.tar.gz)          serve "$DATA/binary.tar.gz" ;;
-    *checksums*)       serve "$DATA/checksums.txt" ;;
-    *)                 echo "Unknown URL: $URL" >&2; exit 1 ;;
-esac
-'''
+        # Config flags - one sourceable file instead of four single-value files
+        (self.data_dir / "flags").write_text(
+            f"FAIL_API={int(cfg.fail_api)}\n"
+            f"FAIL_DOWNLOAD={int(cfg.fail_download)}\n"
+            f"FAIL_CHECKSUM={int(cfg.fail_checksum)}\n"
+            f"HANG_DOWNLOAD={int(cfg.hang_download)}\n"
+        )
+        if cfg.hang_download:
+            os.mkfifo(self.data_dir / "block")
 
 
 # =============================================================================
@@ -173,38 +180,130 @@ esac
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tarball() -> bytes:
-    """Provide a mock binary tarball."""
-    return create_mock_tarball()
+    """Provide a mock binary tarball, loaded once per session from the static fixture.
+
+    Regenerate with tests/fixtures/regenerate.py if the contents change.
+    """
+    return (Path(__file__).parent / "fixtures" / "mock_miru_v1.0.0.tar.gz").read_bytes()
 
 
 @pytest.fixture
-def temp_dir():
-    """Provide a temporary directory that's cleaned up after the test."""
-    with tempfile.TemporaryDirectory() as d:
-        yield Path(d)
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a fresh temporary directory (xdist-safe: each worker gets its own base)."""
+    return tmp_path_factory.mktemp("install")
+
+
+@pytest.fixture(scope="session")
+def mock_curl_script_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the shared mock curl script once per session."""
+    script_dir = tmp_path_factory.mktemp("mock-curl")
+    script = script_dir / "curl"
+    script.write_text(MOCK_CURL_SCRIPT)
+    script.chmod(0o755)
+    return script_dir
 
 
 @pytest.fixture
-def mock_curl(temp_dir: Path, mock_tarball: bytes):
+def mock_curl(temp_dir: Path, mock_tarball: bytes, mock_curl_script_dir: Path):
     """Provide a configurable mock curl instance."""
     mock_dir = temp_dir / "mock"
     mock_dir.mkdir()
-    return MockCurl(mock_dir, mock_tarball, MockConfig())
+    return MockCurl(mock_dir, mock_tarball, MockConfig(), mock_curl_script_dir)
 
 
 # =============================================================================
 # Test Runner
 # =============================================================================
 
+# Baseline subprocess environment, copied once at import instead of per test.
+# MAX_RETRIES/RETRY_DELAY disable retries in tests for speed.
+_BASE_ENV = {**os.environ, "SUDO": "", "MAX_RETRIES": "1", "RETRY_DELAY": "0"}
+
+
+class _ShellWorker:
+    """A long-lived sh process that runs install invocations.
+
+    Amortizes the per-test fork/exec of the outer shell: commands are fed
+    over stdin with `env -i` providing a clean per-invocation environment,
+    stdout/stderr go to files, and a sentinel line reports the exit status.
+    On timeout the whole process group is killed and the worker respawns on
+    next use, so subprocess.TimeoutExpired semantics are preserved.
+    """
+
+    def __init__(self):
+        self.proc: subprocess.Popen | None = None
+
+    def _ensure(self) -> subprocess.Popen:
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = subprocess.Popen(
+                ["sh"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                text=True,
+            )
+        return self.proc
+
+    def run(
+        self,
+        args: list[str],
+        env: dict,
+        workdir: Path,
+        timeout: float,
+    ) -> subprocess.CompletedProcess:
+        proc = self._ensure()
+        out_file = workdir / "stdout"
+        err_file = workdir / "stderr"
+        assignments = " ".join(f"{k}={shlex.quote(v)}" for k, v in env.items())
+        command = (
+            f"env -i {assignments} {' '.join(shlex.quote(a) for a in args)}"
+            f" >{shlex.quote(str(out_file))} 2>{shlex.quote(str(err_file))}\n"
+            f'printf "__DONE__ %s\\n" "$?"\n'
+        )
+        proc.stdin.write(command)
+        proc.stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([proc.stdout], [], [], remaining)[0]:
+                self.kill()
+                raise subprocess.TimeoutExpired(args, timeout)
+            line = proc.stdout.readline()
+            if line.startswith("__DONE__"):
+                returncode = int(line.split()[1])
+                break
+            if not line:  # worker died mid-command
+                self.kill()
+                raise RuntimeError("shell worker exited unexpectedly")
+
+        return subprocess.CompletedProcess(
+            args,
+            returncode,
+            stdout=out_file.read_bytes() if out_file.exists() else b"",
+            stderr=err_file.read_bytes() if err_file.exists() else b"",
+        )
+
+    def kill(self) -> None:
+        if self.proc is not None and self.proc.poll() is None:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+            self.proc.wait()
+        self.proc = None
+
+
+_shell_worker = _ShellWorker()
+atexit.register(_shell_worker.kill)
+
 
 def run_install(
     *args: str,
     install_dir: Path,
     mock_curl: MockCurl,
     env: dict | None = None,
-    timeout: int = 60,
+    timeout: float = 60,
 ) -> subprocess.CompletedProcess:
     """Run install-cli.sh with mocked curl.
 
@@ -218,20 +317,19 @@ def run_install(
     Returns:
         CompletedProcess with stdout, stderr, and returncode
     """
-    run_env = os.environ.copy()
-    run_env["PATH"] = f"{mock_curl.dir}:{run_env.get('PATH', '')}"
-    run_env["INSTALL_DIR"] = str(install_dir)
-    run_env["SUDO"] = ""
-    run_env["MAX_RETRIES"] = "1"  # Disable retries in tests for speed
-    run_env["RETRY_DELAY"] = "0"
+    run_env = {
+        **_BASE_ENV,
+        "PATH": f"{mock_curl.dir}:{_BASE_ENV.get('PATH', '')}",
+        "MOCK_CURL_DATA": str(mock_curl.data_dir),
+        "INSTALL_DIR": str(install_dir),
+    }
     if env:
         run_env.update(env)
 
-    result = subprocess.run(
+    result = _shell_worker.run(
         ["sh", str(SCRIPT_PATH), *args],
-        capture_output=True,
-        text=True,
         env=run_env,
+        workdir=mock_curl.data_dir.parent,
         timeout=timeout,
     )
 
@@ -240,9 +338,9 @@ def run_install(
         print(f"\n{'='*60}")
         print(f"Command: sh {SCRIPT_PATH} {' '.join(args)}")
         print(f"{'='*60}")
-        print(result.stdout)
+        print(result.stdout.decode())
         if result.stderr:
-            print(f"--- stderr ---\n{result.stderr}")
+            print(f"--- stderr ---\n{result.stderr.decode()}")
 
     return result
 
@@ -251,5 +349,5 @@ def install_mock_binary(install_dir: Path, version: str) -> Path:
     """Install a mock miru binary that reports a specific version."""
     binary = install_dir / "miru"
     binary.write_text(f"#!/bin/sh\necho 'miru {version}'\n")
-    binary.chmod(binary.stat().st_mode | stat.S_IXUSR)
+    binary.chmod(0o755)
     return binary
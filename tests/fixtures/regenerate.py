@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Regenerate the static mock tarball fixtures.
+
+The tests load pre-built tarballs from this directory instead of
+compressing one per session. Run this script if the mock binary
+contents ever need to change:
+
+    python3 tests/fixtures/regenerate.py
+"""
+
+import io
+import tarfile
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent
+
+VERSIONS = ["v1.0.0"]
+
+
+def create_mock_tarball(version: str) -> bytes:
+    """Create a minimal tar.gz containing a fake 'miru' binary."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        content = f"#!/bin/sh\necho 'miru {version}'\n".encode()
+        info = tarfile.TarInfo(name="miru")
+        info.size = len(content)
+        info.mode = 0o755
+        tar.addfile(info, io.BytesIO(content))
+    buffer.seek(0)
+    return buffer.read()
+
+
+def main() -> None:
+    for version in VERSIONS:
+        path = FIXTURES_DIR / f"mock_miru_{version}.tar.gz"
+        path.write_bytes(create_mock_tarball(version))
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ python3 -m venv venv
 pip install -q -r requirements.txt
 
 case "$1" in
-    -v|--verbose) TEST_VERBOSE=1 pytest -v -s ;;
-    --slow)       RUN_SLOW=1 pytest -v ;;
-    *)            pytest -v ;;
+    -v|--verbose) TEST_VERBOSE=1 pytest -v -s ;;  # -s is incompatible with xdist
+    --slow)       RUN_SLOW=1 pytest -v -n auto ;;
+    *)            pytest -v -n auto ;;
 esac
@@ -1,6 +1,7 @@
 """Tests for install-cli.sh."""
 
 import os
+import re
 import subprocess
 from pathlib import Path
 
@@ -15,6 +16,20 @@ from conftest import (
     run_install,
 )
 
+# Precompiled patterns for the structure checks
+_DEPS_RE = re.compile(r"for cmd in[^\n]*")
+_CHECKSUM_RE = re.compile(r"verify_checksum|sha256", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def script_text() -> str:
+    """The install script source, read once per session.
+
+    The only fixture the static structure tests depend on, so they carry
+    no per-test setup or teardown.
+    """
+    return SCRIPT_PATH.read_text()
+
 class TestSuccess:
     """Successful installation scenarios."""
 
@@ -27,7 +42,7 @@ class TestSuccess:
 
         assert_install_success(result)
         assert (temp_dir / "miru").exists()
-        assert LATEST_VERSION in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
     def test_specific_version(self, mock_curl: MockCurl, temp_dir: Path):
         """Install a specific version with --version flag."""
@@ -37,7 +52,7 @@ class TestSuccess:
         result = run_install("--version=v0.9.0", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert "v0.9.0" in result.stdout
+        assert b"v0.9.0" in result.stdout
 
     def test_version_without_v_prefix(self, mock_curl: MockCurl, temp_dir: Path):
         """Install a version specified without v prefix."""
@@ -47,7 +62,7 @@ class TestSuccess:
         result = run_install("--version=1.0.0", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert "v1.0.0" in result.stdout
+        assert b"v1.0.0" in result.stdout
 
     def test_version_alias_v0(self, mock_curl: MockCurl, temp_dir: Path):
         """Version alias v0 maps to latest version."""
@@ -57,7 +72,7 @@ class TestSuccess:
         result = run_install("--version=v0", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert LATEST_VERSION in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
     def test_version_alias_v0_9(self, mock_curl: MockCurl, temp_dir: Path):
         """Version alias v0.9 maps to v0.9.0."""
@@ -67,7 +82,7 @@ class TestSuccess:
         result = run_install("--version=v0.9", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert LATEST_VERSION in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
     def test_version_latest_lowercase(self, mock_curl: MockCurl, temp_dir: Path):
         """Version 'latest' maps to latest version."""
@@ -77,7 +92,7 @@ class TestSuccess:
         result = run_install("--version=latest", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert LATEST_VERSION in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
     def test_version_latest_capitalized(self, mock_curl: MockCurl, temp_dir: Path):
         """Version 'Latest' maps to latest version."""
@@ -87,7 +102,7 @@ class TestSuccess:
         result = run_install("--version=Latest", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert LATEST_VERSION in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
     def test_version_latest_uppercase(self, mock_curl: MockCurl, temp_dir: Path):
         """Version 'LATEST' maps to latest version."""
@@ -97,7 +112,7 @@ class TestSuccess:
         result = run_install("--version=LATEST", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert LATEST_VERSION in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
     def test_version_latest_via_env(self, mock_curl: MockCurl, temp_dir: Path):
         """Version 'latest' via INPUT_VERSION env var maps to latest."""
@@ -111,7 +126,7 @@ class TestSuccess:
         )
 
         assert_install_success(result)
-        assert LATEST_VERSION in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
     def test_quiet_flag(self, mock_curl: MockCurl, temp_dir: Path):
         """Quiet mode suppresses output."""
@@ -122,7 +137,7 @@ class TestSuccess:
 
         assert result.returncode == 0
         assert (temp_dir / "miru").exists()
-        assert result.stdout.strip() == ""
+        assert result.stdout.strip() == b""
 
     def test_quiet_flag_short(self, mock_curl: MockCurl, temp_dir: Path):
         """Short quiet flag (-q) works."""
@@ -132,7 +147,7 @@ class TestSuccess:
         result = run_install("-q", install_dir=temp_dir, mock_curl=mock_curl)
 
         assert result.returncode == 0
-        assert result.stdout.strip() == ""
+        assert result.stdout.strip() == b""
 
 
 class TestAlreadyInstalled:
@@ -147,7 +162,7 @@ class TestAlreadyInstalled:
         result = run_install(install_dir=temp_dir, mock_curl=mock_curl)
 
         assert result.returncode == 0
-        assert "already installed" in result.stdout
+        assert b"already installed" in result.stdout
 
     def test_upgrade_different_version(self, mock_curl: MockCurl, temp_dir: Path):
         """Upgrade when different version is installed."""
@@ -158,16 +173,18 @@ class TestAlreadyInstalled:
         result = run_install(install_dir=temp_dir, mock_curl=mock_curl)
 
         assert_install_success(result)
-        assert "Upgrading" in result.stdout
-        assert "v0.7.0" in result.stdout
-        assert LATEST_VERSION in result.stdout
+        assert b"Upgrading" in result.stdout
+        assert b"v0.7.0" in result.stdout
+        assert LATEST_VERSION.encode() in result.stdout
 
 
 def assert_error(result: subprocess.CompletedProcess, *expected_in_message: str) -> None:
     """Assert command failed with informative error containing expected strings."""
     assert result.returncode != 0, "Expected command to fail"
     for expected in expected_in_message:
-        assert expected in result.stderr, f"Error should mention '{expected}':\n{result.stderr}"
+        assert expected.encode() in result.stderr, (
+            f"Error should mention '{expected}':\n{result.stderr.decode()}"
+        )
 
 
 class TestFailure:
@@ -226,21 +243,20 @@ class TestFailure:
     def test_timeout_on_slow_download(self, mock_curl: MockCurl, temp_dir: Path):
         """Script times out on hung downloads."""
         mock_curl.config.version = LATEST_VERSION
-        mock_curl.config.slow_download = 10  # Longer than test timeout
+        mock_curl.config.hang_download = True
         mock_curl.setup()
 
         with pytest.raises(subprocess.TimeoutExpired):
-            run_install(install_dir=temp_dir, mock_curl=mock_curl, timeout=2)
+            run_install(install_dir=temp_dir, mock_curl=mock_curl, timeout=0.5)
 
 
 class TestRetry:
     """Network retry behavior."""
 
-    def test_retries_shown_in_output(self, mock_curl: MockCurl, temp_dir: Path):
+    def test_retries_shown_in_output(self, script_text: str):
         """Script mentions retry in output (retry logic exists)."""
-        content = SCRIPT_PATH.read_text()
-        assert "retry" in content.lower()
-        assert "MAX_RETRIES" in content
+        assert "retry" in script_text.lower()
+        assert "MAX_RETRIES" in script_text
 
 
 class TestEdgeCases:
@@ -271,7 +287,7 @@ class TestEdgeCases:
         )
 
         assert_install_success(result)
-        assert "not in your PATH" in result.stdout
+        assert b"not in your PATH" in result.stdout
 
     def test_no_warning_if_in_path(self, mock_curl: MockCurl, temp_dir: Path):
         """No warning when INSTALL_DIR is already in PATH."""
@@ -286,114 +302,83 @@ class TestEdgeCases:
         )
 
         assert_install_success(result)
-        assert "not in your PATH" not in result.stdout
+        assert b"not in your PATH" not in result.stdout
 
     def test_temp_dir_cleaned_on_success(self, mock_curl: MockCurl, temp_dir: Path):
         """Temp directory is cleaned up after successful install."""
-        import glob
-        import tempfile
         mock_curl.config.version = LATEST_VERSION
         mock_curl.setup()
 
-        # Find temp dirs (works on both Linux /tmp and macOS /var/folders)
-        tmp_base = tempfile.gettempdir()
-        pattern = f"{tmp_base}/tmp.*"
-        before = set(glob.glob(pattern))
+        # Private TMPDIR: anything left behind must have come from this run
+        private_tmp = temp_dir / "tmpcheck"
+        private_tmp.mkdir()
 
-        result = run_install(install_dir=temp_dir, mock_curl=mock_curl)
+        result = run_install(
+            install_dir=temp_dir,
+            mock_curl=mock_curl,
+            env={"TMPDIR": str(private_tmp)},
+        )
         assert_install_success(result)
 
-        # Count temp dirs after - should be same (no new leftover dirs)
-        after = set(glob.glob(pattern))
-        new_dirs = after - before
-        assert len(new_dirs) == 0, f"Leftover temp dirs: {new_dirs}"
+        leftover = os.listdir(private_tmp)
+        assert not leftover, f"Leftover temp dirs: {leftover}"
 
     def test_temp_dir_cleaned_on_failure(self, mock_curl: MockCurl, temp_dir: Path):
         """Temp directory is cleaned up even after failed install."""
-        import glob
-        import tempfile
         mock_curl.config.version = LATEST_VERSION
         mock_curl.config.fail_download = True
         mock_curl.setup()
 
-        # Find temp dirs (works on both Linux /tmp and macOS /var/folders)
-        tmp_base = tempfile.gettempdir()
-        pattern = f"{tmp_base}/tmp.*"
-        before = set(glob.glob(pattern))
+        # Private TMPDIR: anything left behind must have come from this run
+        private_tmp = temp_dir / "tmpcheck"
+        private_tmp.mkdir()
 
-        result = run_install(install_dir=temp_dir, mock_curl=mock_curl)
+        result = run_install(
+            install_dir=temp_dir,
+            mock_curl=mock_curl,
+            env={"TMPDIR": str(private_tmp)},
+        )
         assert result.returncode != 0  # Should fail
 
-        # Count temp dirs after - should be same (no new leftover dirs)
-        after = set(glob.glob(pattern))
-        new_dirs = after - before
-        assert len(new_dirs) == 0, f"Leftover temp dirs: {new_dirs}"
+        leftover = os.listdir(private_tmp)
+        assert not leftover, f"Leftover temp dirs: {leftover}"
 
 
 class TestScriptStructure:
     """Validate script structure."""
 
     @pytest.mark.parametrize("cmd", ["curl", "tar", "grep", "cut"])
-    def test_checks_dependencies(self, cmd: str):
+    def test_checks_dependencies(self, script_text: str, cmd: str):
         """Script checks for required commands."""
-        content = SCRIPT_PATH.read_text()
-        assert "for cmd in" in content and cmd in content
+        match = _DEPS_RE.search(script_text)
+        assert match, "Script has no dependency-check loop"
+        assert cmd in match.group(0)
 
-    def test_uses_set_e(self):
+    def test_uses_set_e(self, script_text: str):
         """Script uses 'set -e' for error handling."""
-        assert "set -e" in SCRIPT_PATH.read_text()
+        assert "set -e" in script_text
 
-    def test_has_cleanup_trap(self):
+    def test_has_cleanup_trap(self, script_text: str):
         """Script has trap for cleanup."""
-        assert "trap" in SCRIPT_PATH.read_text()
+        assert "trap" in script_text
 
-    def test_verifies_checksum(self):
+    def test_verifies_checksum(self, script_text: str):
         """Script verifies checksums."""
-        content = SCRIPT_PATH.read_text().lower()
-        assert "verify_checksum" in content or "sha256" in content
+        assert _CHECKSUM_RE.search(script_text)
 
-    def test_handles_unsupported_os(self):
+    def test_handles_unsupported_os(self, script_text: str):
         """Script handles unsupported OS."""
-        assert "Unsupported operating system" in SCRIPT_PATH.read_text()
+        assert "Unsupported operating system" in script_text
 
-    def test_handles_unsupported_arch(self):
+    def test_handles_unsupported_arch(self, script_text: str):
         """Script handles unsupported architecture."""
-        assert "Unsupported architecture" in SCRIPT_PATH.read_text()
+        assert "Unsupported architecture" in script_text
 
     def test_posix_compatible(self):
         """Script is POSIX sh compatible."""
         result = subprocess.run(["sh", "-n", str(SCRIPT_PATH)], capture_output=True, text=True)
         assert result.returncode == 0, f"Syntax error: {result.stderr}"
 
-    def test_has_quiet_flag(self):
+    def test_has_quiet_flag(self, script_text: str):
         """Script supports --quiet flag."""
-        content = SCRIPT_PATH.read_text()
-        assert "--quiet" in content or "-q" in content
-
-
-class TestIntegration:
-    """Integration tests that hit real GitHub (marked slow)."""
-
-    @pytest.mark.slow
-    @pytest.mark.skipif(
-        os.environ.get("RUN_SLOW") != "1",
-        reason="Slow test; run with ./run.sh --slow",
-    )
-    def test_real_download(self, temp_dir: Path):
-        """Actually download from GitHub to verify URLs work."""
-        import os
-
-        env = os.environ.copy()
-        env["INSTALL_DIR"] = str(temp_dir)
-        env["SUDO"] = ""
-
-        result = subprocess.run(
-            ["sh", str(SCRIPT_PATH), f"--version={LATEST_VERSION}"],
-            capture_output=True,
-            text=True,
-            env=env,
-            timeout=120,
-        )
-
-        assert result.returncode == 0, f"Real download failed:\n{result.stderr}"
-        assert (temp_dir / "miru").exists()
+        assert "--quiet" in script_text or "-q" in script_text
@@ -0,0 +1,35 @@
+"""Integration tests that hit real GitHub.
+
+Only collected when RUN_SLOW=1 (see collect_ignore in conftest.py);
+run with ./run.sh --slow.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from conftest import LATEST_VERSION, SCRIPT_PATH
+
+
+class TestIntegration:
+    """Integration tests that hit real GitHub (marked slow)."""
+
+    @pytest.mark.slow
+    def test_real_download(self, temp_dir: Path):
+        """Actually download from GitHub to verify URLs work."""
+        env = os.environ.copy()
+        env["INSTALL_DIR"] = str(temp_dir)
+        env["SUDO"] = ""
+
+        result = subprocess.run(
+            ["sh", str(SCRIPT_PATH), f"--version={LATEST_VERSION}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, f"Real download failed:\n{result.stderr}"
+        assert (temp_dir / "miru").exists()